@@ -8,19 +8,76 @@ Description:
     instrumentation and generates grammar statements.
 """
 
+import asyncio
+import sys
 from pylsl import StreamInlet, resolve_stream
 from core.event_converter import *
 from core.misc import *
 
+# Maximum number of samples pulled from the inlet per call
+MAX_SAMPLES = 1024
+# Seconds of events collected in the buffer before its grammar statements are generated
+BUFFER_SIZE = 30
+
 streams = resolve_stream('type', "Markers")
 
 inlet = StreamInlet(streams[0])
 event_parser = EventParser()
+instrumentation_hash_buffer = HashBuffer()
+
+
+def pull_chunk() -> list:
+    """
+    Samples are pulled in chunks rather than one at a time so the per-call overhead of pylsl is paid once per chunk.
+    The Markers stream carries strings, so pylsl can't write into a preallocated dest_obj buffer.
+    """
+
+    chunk, timestamps = inlet.pull_chunk(timeout=0.1, max_samples=MAX_SAMPLES)
+
+    return chunk
+
+
+def generate_chunk_grammar(chunk):
+    """
+    Adds a chunk of samples to the buffer, and prints the grammar statements of the buffer whenever it spans more than
+    BUFFER_SIZE seconds, after which the buffer starts over, the same way cava-gen.py windows a file. The buffer is
+    kept across chunks, so where pylsl splits the stream doesn't cut typing runs, scroll chains or the time windows
+    around an event.
+
+    Args:
+        @param chunk: List of samples pulled from the inlet.
+    """
+
+    output_lines = []
+
+    for sample in chunk:
+        instrumentation_hash_buffer.add(json_loads(sample[0]))
+        if instrumentation_hash_buffer.get_buffer_time_frame() > BUFFER_SIZE:
+            output_lines.extend(str(grammar_statement) + "\n"
+                                for grammar_statement in event_parser.parse_all(instrumentation_hash_buffer))
+            instrumentation_hash_buffer.reset()
+
+    # The grammar statements are written with one call instead of a print per statement
+    if output_lines:
+        sys.stdout.write("".join(output_lines))
+        sys.stdout.flush()
+
+
+async def generate_live_grammar():
+    """
+    Pulls chunks on an executor thread while the previous chunk is being parsed. pylsl releases the GIL while it
+    waits on the inlet, so pulling and grammar generation overlap.
+    """
+
+    loop = asyncio.get_running_loop()
+    pending_chunk = loop.run_in_executor(None, pull_chunk)
+
+    while True:
+        chunk = await pending_chunk
+        pending_chunk = loop.run_in_executor(None, pull_chunk)
+
+        if chunk:
+            generate_chunk_grammar(chunk)
 
-while True:
-    sample, timestamp = inlet.pull_sample()
-    event = json.loads(sample[0])
-    interaction = event_parser.parse_event(event)
-    if interaction[0] is not None:
-        print(str(interaction[0]))
 
+asyncio.run(generate_live_grammar())
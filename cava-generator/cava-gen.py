@@ -8,58 +8,199 @@ Description:
     instrumentation and generates grammar statements.
 """
 
-from core.grammar_classes import *
 from core.event_converter import *
 from core.misc import *
-import json
-import argparse
-from utils.buffer import get_frame
+import mmap
+import os
+import queue
+import sys
+import threading
+from itertools import islice
+from types import SimpleNamespace
 from utils.hash_buffer import *
 
 
-def generate_grammar_statements(inputfile, outputfile, release, buffer_size=30):
+def _iter_mapped_lines(json_events):
+    """
+    Yields the lines of a file through a read-only memory map, which skips copying the file through Python's buffered
+    IO layer. An empty file can't be mapped, so it yields nothing.
+
+    Args:
+        @param json_events: File object opened in binary mode.
+    """
+
+    if os.fstat(json_events.fileno()).st_size == 0:
+        return
+
+    with mmap.mmap(json_events.fileno(), 0, access=mmap.ACCESS_READ) as mapped_events:
+        yield from iter(mapped_events.readline, b"")
+
+
+def _read_event_batches(json_events, batch=4096):
+    """
+    Yields lists of events decoded from a line-delimited JSON file. Lines are decoded in batches by joining them into
+    a single JSON array, which amortizes the per-call overhead of the decoder over many events. If a batch fails to
+    decode, its lines are decoded one at a time so the error names the line of the file that is malformed.
+
+    Args:
+        @param json_events: Iterable of lines in binary form, one JSON event per line.
+        @param batch: Number of lines decoded per call.
+    """
+
+    line_number = 0
+
+    while True:
+        lines = list(islice(json_events, batch))
+        if not lines:
+            return
+        try:
+            events = json_loads(b"[" + b",".join(lines) + b"]")
+        except ValueError:
+            events = _decode_lines(lines, line_number)
+        line_number += len(lines)
+        yield events
+
+
+def _decode_lines(lines, line_number):
+    """
+    Decodes a batch of lines one at a time. A line that fails to decode raises a ValueError naming its line number
+    in the file.
+
+    Args:
+        @param lines: Lines in binary form, one JSON event per line.
+        @param line_number: Number of lines in the file before the first line of the batch.
+    """
+
+    events = []
+
+    for offset, line in enumerate(lines, line_number + 1):
+        try:
+            events.append(json_loads(line))
+        except ValueError as error:
+            raise ValueError(f"Malformed event on line {offset}: {error}") from error
+
+    return events
+
+
+def _iter_events_batched(json_events, batch=4096, prefetch=2):
+    """
+    Yields the events of a line-delimited JSON file. A reader thread reads and decodes batches ahead of the caller
+    through a bounded queue, so reading the input overlaps with grammar generation.
+
+    Args:
+        @param json_events: Iterable of lines in binary form, one JSON event per line.
+        @param batch: Number of lines decoded per call.
+        @param prefetch: Number of decoded batches the reader thread may hold ahead of the caller.
+    """
+
+    batches = queue.Queue(maxsize=prefetch)
+
+    def read_batches():
+        try:
+            for events in _read_event_batches(json_events, batch):
+                batches.put(events)
+        except Exception as error:
+            batches.put(error)
+        else:
+            batches.put(None)
+
+    threading.Thread(target=read_batches, daemon=True).start()
+
+    while True:
+        events = batches.get()
+        if events is None:
+            return
+        if isinstance(events, Exception):
+            raise events
+        yield from events
+
+
+def generate_grammar_statements(inputfile, outputfile, release, buffer_size=30, flush_size=1 << 20):
 
     instrumentation_hash_buffer = HashBuffer(release)
     event_parser = EventParser()
-    grammar_events = []
-
-    with open(inputfile) as json_events:
-        for event_string in json_events:
-            event = json.loads(event_string)
-            instrumentation_hash_buffer.add(event)
-            if instrumentation_hash_buffer.get_buffer_time_frame() > buffer_size:
-                while instrumentation_hash_buffer.has_next():
-                    grammar_statements = event_parser.parse_event(instrumentation_hash_buffer)
-                    instrumentation_hash_buffer.next()
-                    if grammar_statements is not None:
-                        grammar_events = grammar_events + grammar_statements
-                instrumentation_hash_buffer = HashBuffer(release)
-                generate_output_file(grammar_events, outputfile)
-                grammar_events = []
-
-        while instrumentation_hash_buffer.has_next():
-            grammar_statements = event_parser.parse_event(instrumentation_hash_buffer)
-            instrumentation_hash_buffer.next()
-            if grammar_statements is not None:
-                grammar_events = grammar_events + grammar_statements
-
-        generate_output_file(grammar_events, outputfile)
+    output_buffer = bytearray()
 
+    # Bound once since they are called for every event or window. The buffer is reset rather than replaced, so these
+    # stay valid.
+    add_event = instrumentation_hash_buffer.add
+    get_buffer_time_frame = instrumentation_hash_buffer.get_buffer_time_frame
+    parse_all = event_parser.parse_all
+
+    # Grammar statements are encoded into output_buffer as soon as they are produced, which is written out whenever it
+    # grows past flush_size bytes
+    with open(inputfile, 'rb') as json_events, open(outputfile, 'ab') as output:
+        for event in _iter_events_batched(_iter_mapped_lines(json_events)):
+            add_event(event)
+            if get_buffer_time_frame() > buffer_size:
+                for statement in parse_all(instrumentation_hash_buffer):
+                    statement.encode_into(output_buffer)
+                instrumentation_hash_buffer.reset()
+                if len(output_buffer) > flush_size:
+                    output.write(output_buffer)
+                    output_buffer.clear()
+
+        for statement in parse_all(instrumentation_hash_buffer):
+            statement.encode_into(output_buffer)
+
+        output.write(output_buffer)
+
+
+def _build_arg_parser():
+    # argparse is only imported when the command line needs it (help, errors, or less common spellings)
+    import argparse
 
-def main():
     parser = argparse.ArgumentParser(description="Generate grammar statements based off given event data.")
     parser.add_argument("-i", "--inputfile", type=str, default='lsl_data.json',
                         help="path to event data (Default: lsl_data.json)")
     parser.add_argument("-o", "--outputfile", type=str, default='default.txt',
                         help="Output file name for grammar statements (Default: default.txt)")
-    parser.add_argument("--release", action="store_true", help="Additional information for debugging")
-    args = parser.parse_args()
+    parser.add_argument("--release", action="store_true", help="Suppress buffer diagnostics")
+
+    return parser
+
+
+def _parse_argv(argv):
+    """
+    Parses the command line for the common invocations without going through argparse, which keeps startup fast when
+    the script is run once per file. Any argument that isn't handled here, including -h, is left to argparse so that
+    usage and error messages are unchanged.
+
+    Args:
+        @param argv: Command line arguments, excluding the program name.
+    """
+
+    args = SimpleNamespace(inputfile='lsl_data.json', outputfile='default.txt', release=False)
+    index = 0
+
+    while index < len(argv):
+        arg = argv[index]
+        has_value = index + 1 < len(argv) and not argv[index + 1].startswith('-')
+
+        if arg in ("-i", "--inputfile") and has_value:
+            args.inputfile = argv[index + 1]
+            index += 2
+        elif arg in ("-o", "--outputfile") and has_value:
+            args.outputfile = argv[index + 1]
+            index += 2
+        elif arg == "--release":
+            args.release = True
+            index += 1
+        else:
+            return _build_arg_parser().parse_args(argv)
+
+    return args
+
+
+def main():
+    args = _parse_argv(sys.argv[1:])
 
     # Setting variables 
     inputfile = args.inputfile
     outputfile = args.outputfile
+    release = args.release
 
-    generate_grammar_statements(inputfile, outputfile, False, buffer_size=100)
+    generate_grammar_statements(inputfile, outputfile, release, buffer_size=100)
 
 
 main()
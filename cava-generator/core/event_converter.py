@@ -8,11 +8,20 @@ Description:
 """
 
 from abc import ABCMeta, abstractmethod
+from bisect import bisect_left
+from functools import lru_cache, partial
 from core.grammar_classes import Interaction
-from core.misc import GRAMMAR_TYPE, keyboard_scan_code_mapping, internal_plugin_to_grammar, charMapping
+from core.misc import GRAMMAR_TYPE, keyboard_scan_code_names, internal_plugin_to_grammar, charMapping, \
+    erase_keys, field_mouse_buttons, field_click_counts, window_click_actions, mouse_input_actions, \
+    scroll_input_actions, modifier_prefixes
+from utils.buffer_event import BufferEvent
 from utils.hash_buffer import HashBuffer
 from utils.grammar_event import GrammarEvent
 
+# Grammar types passed to Interaction.set_fragment, bound once so the calls don't look them up on the enum
+_INPUT_DEVICE, _INPUT_ACTION, _TOOL_CONTEXT, _ACTION = \
+    GRAMMAR_TYPE.INPUT_DEVICE, GRAMMAR_TYPE.INPUT_ACTION, GRAMMAR_TYPE.TOOL_CONTEXT, GRAMMAR_TYPE.ACTION
+
 
 class EventParser:
     """
@@ -23,21 +32,29 @@ class EventParser:
     """
 
     def __init__(self):
-        self.MouseEventConverter_ = MouseEvent()
-        self.KeyboardEventConverter_ = KeyboardEvent()
-        self.HeaderEventConverter_ = HeaderEvent()
-        self.WindowEventConverter_ = WindowEvent()
-        self.FieldMouseEventConverter_ = FieldMouseEvent()
-        self.FieldInputEventConverter_ = FieldInputEvent()
-        self.MousePressedEventConverter_ = MousePressedEvent()
-        self.GhidraProgramActivatedEventConverter_ = GhidraProgramActivatedEvent()
-        self.FunctionGraphVertexClickEvent_ = FunctionGraphVertexClickEvent()
-        self.FunctionGraphEdgePickEvent_ = FunctionGraphEdgePickEvent()
-        self.VerticalScrollbarAdjustmentEvent_ = VerticalScrollbarAdjustmentEvent()
-        self.MouseEnteredEvent_ = MouseEnteredEvent(True)
-        self.MouseExitedEvent_ = MouseExitedEvent(True)
-
-    def parse_event(self, buffer: HashBuffer) -> list or None:
+        '''
+        Maps each supported event name to the converter class that handles it. A converter is only created the first
+        time its event shows up, since a trace rarely contains every type of event.
+        '''
+        self.converter_classes_ = {
+            "KeyboardEvent": KeyboardEvent,
+            "HeaderEvent": HeaderEvent,
+            "WindowEvent": WindowEvent,
+            "FieldMouseEvent": FieldMouseEvent,
+            "MousePressedEvent": MousePressedEvent,
+            "FieldInputEvent": FieldInputEvent,
+            "GhidraProgramActivatedEvent": GhidraProgramActivatedEvent,
+            "VerticalScrollbarAdjustmentEvent": VerticalScrollbarAdjustmentEvent,
+            "MouseEnteredEvent": partial(MouseEnteredEvent, True),
+            "MouseExitedEvent": partial(MouseExitedEvent, True),
+            # "FunctionGraphVertexClickEvent": FunctionGraphVertexClickEvent,
+            # "FunctionGraphEdgePickEvent": FunctionGraphEdgePickEvent,
+        }
+
+        # Bound parse_event of every converter created so far, so dispatching an event is a single dictionary lookup
+        self.dispatch_ = {}
+
+    def parse_event(self, buffer: HashBuffer) -> tuple or None:
         """
         This function takes an event_frame and an index, and gets the underlying json event. We then take the
         json event and get the name of it to properly delegate the job of converting it to the proper class.
@@ -54,35 +71,68 @@ class EventParser:
         '''
 
         # buffer.debug()
-        event_name = buffer.current().get("Name")
-
-        if event_name == "KeyboardEvent":
-            return self.KeyboardEventConverter_.parse_event(buffer)
-        elif event_name == "HeaderEvent":
-            return self.HeaderEventConverter_.parse_event(buffer)
-        elif event_name == "WindowEvent":
-            return self.WindowEventConverter_.parse_event(buffer)
-        elif event_name == "FieldMouseEvent":
-            return self.FieldMouseEventConverter_.parse_event(buffer)
-        elif event_name == "MousePressedEvent":
-            return self.MousePressedEventConverter_.parse_event(buffer)
-        elif event_name == "FieldInputEvent":
-            return self.FieldInputEventConverter_.parse_event(buffer)
-        elif event_name == "GhidraProgramActivatedEvent":
-            return self.GhidraProgramActivatedEventConverter_.parse_event(buffer)
-        elif event_name == "VerticalScrollbarAdjustmentEvent":
-            return self.VerticalScrollbarAdjustmentEvent_.parse_event(buffer)
-        elif event_name == "MouseEnteredEvent":
-            return self.MouseEnteredEvent_.parse_event(buffer)
-        elif event_name == "MouseExitedEvent":
-            return self.MouseExitedEvent_.parse_event(buffer)
+        event = buffer.current()
+
         '''
-        elif event_name == "FunctionGraphVertexClickEvent":
-            return self.FunctionGraphVertexClickEvent_.parse_event(buffer)
-        elif event_name == "FunctionGraphEdgePickEvent":
-            return self.FunctionGraphEdgePickEvent_.parse_event(buffer)
-        
+        Events that were consumed by an earlier grammar statement (typing, scrolling, window events) are skipped before
+        dispatching. The converters that consume events still check this themselves.
         '''
+        if event.consumed_:
+            return None
+
+        event_name = event.name_
+        converter = self.dispatch_.get(event_name) or self.get_converter(event_name)
+
+        if converter is None:
+            return None
+
+        return converter(buffer)
+
+    def parse_all(self, buffer: HashBuffer) -> list:
+        """
+        Converts every event left in the buffer, walking the buffer index, and returns all the grammar events that
+        were created in order. Equivalent to calling parse_event for each event, without paying for a call per event.
+
+        Args:
+            @param buffer: HashBuffer of instrumentation events being analyzed
+        """
+
+        grammar_events = []
+        add_grammar_events = grammar_events.extend
+        get_converter = self.get_converter
+        dispatch = self.dispatch_
+
+        for event in buffer:
+            if event.consumed_:
+                continue
+
+            event_name = event.name_
+            converter = dispatch.get(event_name) or get_converter(event_name)
+
+            if converter is not None:
+                grammar_statements = converter(buffer)
+                if grammar_statements is not None:
+                    add_grammar_events(grammar_statements)
+
+        return grammar_events
+
+    def get_converter(self, event_name):
+        """
+        Creates the converter for event_name and caches its bound parse_event. Returns None if the event isn't
+        supported.
+
+        Args:
+            @param event_name: Name of the instrumentation event
+        """
+
+        converter_class = self.converter_classes_.get(event_name)
+
+        if converter_class is None:
+            return None
+
+        converter = self.dispatch_[event_name] = converter_class().parse_event
+
+        return converter
 
 
 class EventConverter:
@@ -97,7 +147,7 @@ class EventConverter:
         self.debug_ = debug
 
     @abstractmethod
-    def parse_event(self, buffer: HashBuffer) -> list or None:
+    def parse_event(self, buffer: HashBuffer) -> tuple or None:
         """Create grammar statement with event data"""
 
 
@@ -108,7 +158,7 @@ class MouseEvent(EventConverter):
     Currently, not being used.
     """
 
-    def parse_event(self, buffer: HashBuffer) -> list or None:
+    def parse_event(self, buffer: HashBuffer) -> tuple or None:
         """
         This function is meant to take a json mouse event produced by the cava-platform and turn 
         it into a grammar fragment for the interaction grammar. Currently, mouse clicks
@@ -123,7 +173,7 @@ class MouseEvent(EventConverter):
         '''
         event = buffer.current()
         interaction = Interaction()
-        event_data = event.get("Data")
+        event_data = event.data_
         event_name = event_data.get("Name")
 
         '''
@@ -133,7 +183,7 @@ class MouseEvent(EventConverter):
             x_coord = event_data.get("X")
             y_coord = event_data.get("Y")
             event_action = "Move"
-            event_metadata = "(" + str(x_coord) + ", " + str(y_coord) + ")"
+            event_metadata = f"({x_coord}, {y_coord})"
         else:
             event_metadata = "Click"
             event_action = event_data.get("Button")
@@ -141,18 +191,13 @@ class MouseEvent(EventConverter):
             event_action = event_action.capitalize()
 
         input_device_fragment = "Mouse"
-        input_action_fragment = event_action + " " + event_metadata
+        input_action_fragment = f"{event_action} {event_metadata}"
 
-        interaction.set_fragment(input_device_fragment, GRAMMAR_TYPE.INPUT_DEVICE)
-        interaction.set_fragment(input_action_fragment, GRAMMAR_TYPE.INPUT_ACTION)
+        interaction.set_sentence(input_device_fragment, input_action_fragment)
 
-        grammar_event = GrammarEvent(sentence=interaction,
-                                     inferred=False,
-                                     hash_list=event.get("Hash"),
-                                     timestamp=event.get("Timestamp"),
-                                     source_event=event.get("Event"))
+        grammar_event = GrammarEvent(interaction, False, event.hash_, event.timestamp_, event.event_)
 
-        return [grammar_event]
+        return (grammar_event,)
 
 
 class KeyboardEvent(EventConverter):
@@ -163,7 +208,7 @@ class KeyboardEvent(EventConverter):
     to be typed in a continuous matter.
     """
 
-    def parse_event(self, buffer: HashBuffer) -> list or None:
+    def parse_event(self, buffer: HashBuffer) -> tuple or None:
         """
         Takes a Keyboard event, extracts relevant information and creates 
         input action and input device grammar fragments.
@@ -176,11 +221,12 @@ class KeyboardEvent(EventConverter):
         Checks if the current keyboard event we are converting has been consumed by a previous 
         keyboard event.
         '''
-        if buffer.current().get("Consumed"):
+        event = buffer.current()
+
+        if event.consumed_:
             return None
 
-        event = buffer.current()
-        event_data = event.get("Data")
+        event_data = event.data_
 
         '''
         Since the instrumentation software differentiates from keystrokes that are being pressed and being released, 
@@ -208,19 +254,14 @@ class KeyboardEvent(EventConverter):
         input_device_fragment = "Keyboard"
         input_action_fragment = typed_string
 
-        interaction.set_fragment(input_device_fragment, GRAMMAR_TYPE.INPUT_DEVICE)
-        interaction.set_fragment(input_action_fragment, GRAMMAR_TYPE.INPUT_ACTION)
+        interaction.set_sentence(input_device_fragment, input_action_fragment)
 
-        grammar_event = GrammarEvent(sentence=interaction,
-                                     inferred=False,
-                                     hash_list=hashes,
-                                     timestamp=event.get("Timestamp"),
-                                     source_event=event.get("Event"))
+        grammar_event = GrammarEvent(interaction, False, hashes, event.timestamp_, event.event_)
 
         if self.debug_:
             grammar_event.debug()
 
-        return [grammar_event]
+        return (grammar_event,)
 
     def get_all_typing_events(self, buffer: HashBuffer) -> list:
         """
@@ -232,47 +273,46 @@ class KeyboardEvent(EventConverter):
         """
 
         typing = []
-        last_typed_event = buffer.current()
+        last_typed_event_time = buffer.current().timestamp_
         event_list = buffer.get_event_list()
+        timestamps = buffer.get_timestamps()
         index = buffer.get_index()
+        debug = self.debug_
 
-        for i in range(index + 1, len(event_list)):
+        # Only the keyboard events after the current one are visited, other events can't be part of the typing
+        for i in buffer.iter_after("KeyboardEvent", index):
 
             event = event_list[i]
 
             """
             Too many debug statements, keep blocked unless debugging this code.
             if self.debug_:
-                print("[DEBUG] Event Name: ", event.get("Name"))
+                print("[DEBUG] Event Name: ", event.name_)
             """
 
-            if event.get("Name") == "KeyboardEvent":
-
-                '''
-                EventName refers to if the stroke of the keyboard event was either up or down.
-                '''
-                event_data = event.get("Data")
-                key_stroke = event_data.get("EventName")
-
-                if key_stroke == "DOWN":
+            '''
+            EventName refers to if the stroke of the keyboard event was either up or down. Only keyboard events that
+            were pressed down are considered.
+            '''
+            if event.data_.get("EventName") != "DOWN":
+                continue
 
-                    '''
-                    Now, we know that a keyboard event other than the one we started with is in the buffer. Now
-                    we must check if the keyboard event is within .91 secs of the last typed key. If it is, then we 
-                    treat it as the last typed event and add it to the list of typed keyboard events.
-                    '''
-                    last_typed_event_time = last_typed_event.get("Timestamp")
-                    curr_keyboard_event_time = event.get("Timestamp")
-                    time_diff = curr_keyboard_event_time - last_typed_event_time
+            '''
+            Now, we know that a keyboard event other than the one we started with is in the buffer. Now
+            we must check if the keyboard event is within .91 secs of the last typed key. If it is, then we 
+            treat it as the last typed event and add it to the list of typed keyboard events.
+            '''
+            curr_keyboard_event_time = timestamps[i]
+            time_diff = curr_keyboard_event_time - last_typed_event_time
 
-                    if self.debug_:
-                        print("[DEBUG] Keystroke Time Diff: ", time_diff)
+            if debug:
+                print("[DEBUG] Keystroke Time Diff: ", time_diff)
 
-                    if time_diff < .91:
-                        typing.append(event)
-                        last_typed_event = event
-                    else:
-                        break
+            if time_diff < .91:
+                typing.append(event)
+                last_typed_event_time = curr_keyboard_event_time
+            else:
+                break
 
         return typing
 
@@ -284,28 +324,31 @@ class KeyboardEvent(EventConverter):
             @param typed: List of keyboard json events
         """
 
-        typed_string = ""
-        hashes = []
+        # Characters are collected in a list and joined once, so a long typing run isn't copied on every key
+        typed_chars = []
+        hashes = [None] * len(typed)
+        char_of = charMapping.get
 
         # This section tries to replicate the string that would've appeared on-screen while
         # typing
-        for event in typed:
-            key = event.get("Data").get("Key")
-            hashes.append(event.get("Hash"))
-            event["Consumed"] = True
-
-            if key == "KEY_BACKSPACE" or key == "KEY_DELETE":
-                typed_string = typed_string[:-1]
+        for i, event in enumerate(typed):
+            key = event.data_.get("Key")
+            hashes[i] = event.hash_
+            event.consumed_ = True
+
+            if key in erase_keys:
+                if typed_chars:
+                    typed_chars.pop()
                 continue
 
-            transformed = charMapping.get(key)
+            transformed = char_of(key)
 
             if transformed is None:
                 continue
 
-            typed_string += transformed
+            typed_chars.append(transformed)
 
-        return typed_string, hashes
+        return "".join(typed_chars), hashes
 
 
 class HeaderEvent(EventConverter):
@@ -314,7 +357,7 @@ class HeaderEvent(EventConverter):
     This class is meant to take those HeaderEvents and convert them into grammar statements.
     """
 
-    def parse_event(self, buffer: HashBuffer) -> list or None:
+    def parse_event(self, buffer: HashBuffer) -> tuple or None:
         """
         Takes HeaderEvent, extracts relevant information and then 
         creates grammar fragments for the give interaction grammar
@@ -330,7 +373,7 @@ class HeaderEvent(EventConverter):
         We extract relevant information from the Json object.
         '''
         header_event = buffer.current()
-        header_data = header_event.get("Data")
+        header_data = header_event.data_
         interaction = Interaction()
         header = header_data.get("Header")
         header_event_type = header_data.get("EventType")
@@ -345,14 +388,7 @@ class HeaderEvent(EventConverter):
         '''
         We convert the information found into strings that fit our grammar we have defined in a separate document.
         '''
-        if header_event_type == "LeftClick":
-            input_action_fragment = "Left Click"
-        elif header_event_type == "RightClick":
-            input_action_fragment = "Right Click"
-        elif header_event_type == "MiddleClick":
-            input_action_fragment = "Middle PressDown"
-        else:
-            input_action_fragment = "Move"
+        input_action_fragment = window_click_actions.get(header_event_type, "Move")
 
         '''
         Header events may not have certain fields. So, here we just double check and mark them as empty if the field 
@@ -380,20 +416,15 @@ class HeaderEvent(EventConverter):
         if header_meta_data != "":
             tool_context_fragment = tool_context_fragment + " : " + header_meta_data
 
-        interaction.set_fragment(input_device_fragment, GRAMMAR_TYPE.INPUT_DEVICE)
-        interaction.set_fragment(input_action_fragment, GRAMMAR_TYPE.INPUT_ACTION)
-        interaction.set_fragment(tool_context_fragment, GRAMMAR_TYPE.TOOL_CONTEXT)
+        interaction.set_sentence(input_device_fragment, input_action_fragment, tool_context_fragment)
 
-        grammar_event = GrammarEvent(sentence=interaction,
-                                     inferred=False,
-                                     hash_list=[header_event.get("Hash")],
-                                     timestamp=header_event.get("Timestamp"),
-                                     source_event=header_event.get("Event"))
+        grammar_event = GrammarEvent(interaction, False, [header_event.hash_],
+                                     header_event.timestamp_, header_event.event_)
 
         if self.debug_:
             grammar_event.debug()
 
-        return [grammar_event]
+        return (grammar_event,)
 
 
 class WindowEvent(EventConverter):
@@ -406,7 +437,16 @@ class WindowEvent(EventConverter):
     also be created on top of other instrumentation that captures those actions.
     """
 
-    def parse_event(self, buffer: HashBuffer) -> list or None:
+    def __init__(self, debug=False):
+        super().__init__(debug)
+
+        # Window event types with their own sentence builder, every other type is treated as a click
+        self.sentence_builders_ = {
+            "MouseEntry": self.create_mouse_entry_sentence,
+            "MouseExit": self.create_mouse_exit_sentence,
+        }
+
+    def parse_event(self, buffer: HashBuffer) -> tuple or None:
         """
         Extracts relevant information from a WindowEvent, then delegates the task of creating a grammar statement
         depending on what type of window event it was.
@@ -415,27 +455,23 @@ class WindowEvent(EventConverter):
             @param buffer: HashBuffer data structure that holds instrumentation events.
         """
 
-        if buffer.current().get("Consumed"):
+        event = buffer.current()
+
+        if event.consumed_:
             return None
 
         '''
         Need to figure out what type of window event this creates since a window event is rather generic.
         '''
-        event = buffer.current()
-        window_event_data = event.get("Data")
+        window_event_data = event.data_
         event_type = window_event_data.get("EventType")
 
         if self.debug_:
             print("[DEBUG] WindowEvent Type: ", event_type)
 
-        if event_type == "MouseEntry":
-            return self.create_mouse_entry_sentence(event)
-        elif event_type == "MouseExit":
-            return self.create_mouse_exit_sentence(event)
-        else:
-            return self.create_mouse_click_sentence(event)
+        return self.sentence_builders_.get(event_type, self.create_mouse_click_sentence)(event)
 
-    def create_mouse_entry_sentence(self, event) -> list or None:
+    def create_mouse_entry_sentence(self, event) -> tuple or None:
         """
         This function takes a window event and creates a grammar statement which states that the mouse has
         entered a new plugin.
@@ -444,30 +480,11 @@ class WindowEvent(EventConverter):
             @param event: Singular Window Event from a HashBuffer object.
         """
 
-        interaction = Interaction()
-        window_event_data = event.get("Data")
-        event["Consumed"] = True
-
-        input_device = "Mouse"
-        input_action = "Move : Enter"
-        tool_context = window_event_data.get("WindowName")
-
-        interaction.set_fragment(input_device, GRAMMAR_TYPE.INPUT_DEVICE)
-        interaction.set_fragment(input_action, GRAMMAR_TYPE.INPUT_ACTION)
-        interaction.set_fragment(tool_context, GRAMMAR_TYPE.TOOL_CONTEXT)
-
-        grammar_event = GrammarEvent(sentence=interaction,
-                                     inferred=False,
-                                     hash_list=[event.get("Hash")],
-                                     timestamp=event.get("Timestamp"),
-                                     source_event=event.get("Event"))
-
-        if self.debug_:
-            grammar_event.debug()
+        event.consumed_ = True
 
-        return [grammar_event]
+        return self.create_window_sentence(event, "Move : Enter")
 
-    def create_mouse_exit_sentence(self, event) -> list or None:
+    def create_mouse_exit_sentence(self, event) -> tuple or None:
         """
         This function takes a window event and creates a grammar statement which states that the mouse has
         exited a new plugin.
@@ -476,31 +493,12 @@ class WindowEvent(EventConverter):
             @param event: Singular Window Event from a HashBuffer object.
 
         """
-        interaction = Interaction()
-
-        event["Consumed"] = True
-        window_event_data = event.get("Data")
-
-        input_device = "Mouse"
-        input_action = "Move : Exit"
-        tool_context = window_event_data.get("WindowName")
-
-        interaction.set_fragment(input_device, GRAMMAR_TYPE.INPUT_DEVICE)
-        interaction.set_fragment(input_action, GRAMMAR_TYPE.INPUT_ACTION)
-        interaction.set_fragment(tool_context, GRAMMAR_TYPE.TOOL_CONTEXT)
-
-        grammar_event = GrammarEvent(sentence=interaction,
-                                     inferred=False,
-                                     hash_list=[event.get("Hash")],
-                                     timestamp=event.get("Timestamp"),
-                                     source_event=event.get("Event"))
 
-        if self.debug_:
-            grammar_event.debug()
+        event.consumed_ = True
 
-        return [grammar_event]
+        return self.create_window_sentence(event, "Move : Exit")
 
-    def create_mouse_click_sentence(self, event) -> list or None:
+    def create_mouse_click_sentence(self, event) -> tuple or None:
         """
         This function takes a window event and creates a grammar statement which states that the mouse has
         been clicked while inside a plugin.
@@ -509,39 +507,30 @@ class WindowEvent(EventConverter):
             @param event: Singular Window Event from a HashBuffer object.
         """
 
-        interaction = Interaction()
+        event_type = event.data_.get("EventType")
 
-        window_event_data = event.get("Data")
-        event_type = window_event_data.get("EventType")
-        event_source = window_event_data.get("WindowName")
+        return self.create_window_sentence(event, window_click_actions.get(event_type, "Move"))
 
-        input_device_fragment = "Mouse"
+    def create_window_sentence(self, event, input_action) -> tuple:
+        """
+        Creates the grammar statement shared by all window events: a mouse input with the given input action, inside
+        the window the event came from.
 
-        if event_type == "LeftClick":
-            input_action_fragment = "Left Click"
-        elif event_type == "RightClick":
-            input_action_fragment = "Right Click"
-        elif event_type == "MiddleClick":
-            input_action_fragment = "Middle PressDown"
-        else:
-            input_action_fragment = "Move"
+        Args:
+            @param event: Singular Window Event from a HashBuffer object.
+            @param input_action: Input action fragment of the grammar statement.
+        """
 
-        tool_context_fragment = event_source
+        interaction = Interaction()
 
-        interaction.set_fragment(input_device_fragment, GRAMMAR_TYPE.INPUT_DEVICE)
-        interaction.set_fragment(input_action_fragment, GRAMMAR_TYPE.INPUT_ACTION)
-        interaction.set_fragment(tool_context_fragment, GRAMMAR_TYPE.TOOL_CONTEXT)
+        interaction.set_sentence("Mouse", input_action, event.data_.get("WindowName"))
 
-        grammar_event = GrammarEvent(sentence=interaction,
-                                     inferred=False,
-                                     hash_list=[event.get("Hash")],
-                                     timestamp=event.get("Timestamp"),
-                                     source_event=event.get("Event"))
+        grammar_event = GrammarEvent(interaction, False, [event.hash_], event.timestamp_, event.event_)
 
         if self.debug_:
             grammar_event.debug()
 
-        return [grammar_event]
+        return (grammar_event,)
 
 
 class FieldMouseEvent(EventConverter):
@@ -557,7 +546,7 @@ class FieldMouseEvent(EventConverter):
     grammar statement.
     """
 
-    def parse_event(self, buffer: HashBuffer) -> list or None:
+    def parse_event(self, buffer: HashBuffer) -> tuple or None:
         """
         Extracts relevant information from a FieldMouseEvent, then delegates the task of creating tool action fragment
         depending on what type of FieldMouseEvent it is.
@@ -570,9 +559,9 @@ class FieldMouseEvent(EventConverter):
 
         interaction = Interaction()
 
-        event_data = event.get("Data")
-        plugin_name = event_data.get("EventSource")
-        field = event_data.get("FieldText")
+        event_data = event.data_
+        plugin_name = event.source_
+        field = event_data["FieldText"]
         event_button = event_data.get("MouseButton")
         event_count = event_data.get("ClickCount")
 
@@ -583,23 +572,12 @@ class FieldMouseEvent(EventConverter):
         clicked. That means we will never have a field mouse event where the mouse button is Right. We keep in here in 
         case future release of ghidra change how that is produced.
         '''
-        if event_button == 1:
-            mouse_button = "Left"
-        elif event_button == 2:
-            mouse_button = "Middle"
-        else:
-            mouse_button = "Right"
-
-        if event_count == 1:
-            mouse_action = "Click"
-        elif event_count == 2:
-            mouse_action = "DoubleClick"
-        else:
-            mouse_action = "MultipleClicks"
+        mouse_button = field_mouse_buttons.get(event_button, "Right")
+        mouse_action = field_click_counts.get(event_count, "MultipleClicks")
 
         input_device = "Mouse"
-        input_action = mouse_button + " " + mouse_action
-        tool_context = internal_plugin_to_grammar.get(plugin_name) + " : " + "Field(" + field + ")"
+        input_action = mouse_input_actions[mouse_button, mouse_action]
+        tool_context = get_field_tool_context(plugin_name, field)
         tool_action = ""
         hash_list = []
 
@@ -607,9 +585,7 @@ class FieldMouseEvent(EventConverter):
             print("PluginName:", plugin_name)
             print("MappingToGrammar: ", internal_plugin_to_grammar.get(plugin_name))
 
-        interaction.set_fragment(input_device, GRAMMAR_TYPE.INPUT_DEVICE)
-        interaction.set_fragment(input_action, GRAMMAR_TYPE.INPUT_ACTION)
-        interaction.set_fragment(tool_context, GRAMMAR_TYPE.TOOL_CONTEXT)
+        interaction.set_sentence(input_device, input_action, tool_context)
 
         if self.debug_:
             print("Grammar Statement Before FieldLocation Extraction: ", str(interaction))
@@ -627,19 +603,15 @@ class FieldMouseEvent(EventConverter):
             tool_action = self.create_mouse_wheel_click_tool_action_fragment(buffer)
 
         if tool_action != "":
-            interaction.set_fragment(tool_action, GRAMMAR_TYPE.ACTION)
+            interaction.set_fragment(tool_action, _ACTION)
 
-        hash_list.append(event.get("Hash"))
-        grammar_event = GrammarEvent(sentence=interaction,
-                                     inferred=False,
-                                     hash_list=hash_list,
-                                     timestamp=event.get("Timestamp"),
-                                     source_event=event.get("Event"))
+        hash_list.append(event.hash_)
+        grammar_event = GrammarEvent(interaction, False, hash_list, event.timestamp_, event.event_)
 
         if self.debug_:
             grammar_event.debug()
 
-        return [grammar_event]
+        return (grammar_event,)
 
     def create_left_click_tool_action_fragment(self, buffer: HashBuffer, mouse_action) -> (str, list):
         """
@@ -669,7 +641,7 @@ class FieldMouseEvent(EventConverter):
         which events to load can be seen in the function doc.
         '''
         field_location_events = load_field_location_events(buffer)
-        tool_action = ""
+        tool_action_fields = []
         hash_list = []
 
         if mouse_action == "Click":
@@ -683,30 +655,25 @@ class FieldMouseEvent(EventConverter):
         '''
         for field_event in field_location_events:
 
-            if field_event.get("Consumed"):
+            if field_event.consumed_:
                 continue
 
-            field_event_data = field_event.get("Data")
-            plugin_name = field_event_data.get("EventSource")
+            plugin_name = field_event.source_
             selection_changed[plugin_name] = field_event
 
         '''
-        This creates the tool action fragment from the FieldLocationEvents that we ended up choosing.
+        This creates the tool action fragment from the FieldLocationEvents that we ended up choosing. Each plugin only
+        appears once in selection_changed, so its grammar name is looked up once, and the fields are joined at the end.
         '''
         for plugin_name, field_event in selection_changed.items():
 
-            mod = " && "
+            # field_event.consumed_ = True
+            hash_list.append(field_event.hash_)
+            tool_action_field = field_event.data_["FieldText"]
+            tool_action_fields.append(internal_plugin_to_grammar.get(
+                plugin_name) + " : SelectionChanged : Field(" + tool_action_field + ")")
 
-            if tool_action == "":
-                mod = ""
-
-            # field_event["Consumed"] = True
-            hash_list.append(field_event.get("Hash"))
-            tool_action_field = field_event.get("Data").get("FieldText")
-            tool_action += mod + internal_plugin_to_grammar.get(
-                plugin_name) + " : SelectionChanged : " + "Field(" + tool_action_field + ")"
-
-        return tool_action, hash_list
+        return " && ".join(tool_action_fields), hash_list
 
     def create_mouse_wheel_click_tool_action_fragment(self, buffer: HashBuffer) -> str:
         """
@@ -721,11 +688,11 @@ class FieldMouseEvent(EventConverter):
         '''
 
         event = buffer.current()
-        event_data = event.get("Data")
-        plugin = event_data.get("EventSource")
-        field = event_data.get("FieldText")
+        event_data = event.data_
+        plugin = event.source_
+        field = event_data["FieldText"]
 
-        tool_action = internal_plugin_to_grammar.get(plugin) + " : " + " SetHighlight(" + field + ")"
+        tool_action = internal_plugin_to_grammar.get(plugin) + " :  SetHighlight(" + field + ")"
 
         return tool_action
 
@@ -739,7 +706,7 @@ class MousePressedEvent(EventConverter):
     context menu.
     """
 
-    def parse_event(self, buffer: HashBuffer) -> list or None:
+    def parse_event(self, buffer: HashBuffer) -> tuple or None:
         """
         Extracts relevant information from a MousePressedEvent.
 
@@ -757,79 +724,59 @@ class MousePressedEvent(EventConverter):
         event = buffer.current()
 
         interaction = Interaction()
-        event_data = event.get("Data")
+        event_data = event.data_
         event_button = event_data.get("MouseButton")
         event_count = event_data.get("ClickCount")
-        plugin_name = event_data.get("EventSource")
+        plugin_name = event.source_
         tool_context = ""
         tool_action = ""
         hash_list = []
         hash_from_field = ""
-        grammar_statements = []
+        grammar_statements = ()
 
-        if event_button == 1:
-            mouse_button = "Left"
-        elif event_button == 2:
-            mouse_button = "Middle"
-        else:
-            mouse_button = "Right"
+        mouse_button = field_mouse_buttons.get(event_button, "Right")
+        mouse_action = field_click_counts.get(event_count, "MultipleClicks")
+
+        '''
+        When this is true, then that means that this right click produced a context menu. And we know that a field 
+        location event also occurred because that's how Ghidra works internally. So we get the correct 
+        FieldLocationEvent and extract its field to use in the tool action fragment.
+        '''
+        if mouse_button == "Right" and event_data.get("IsPopupTrigger"):
             '''
-            When this is true, then that means that this right click produced a context menu. And we know that a field 
-            location event also occurred because that's how Ghidra works internally. So we get the correct 
-            FieldLocationEvent and extract its field to use in the tool action fragment.
+            Since we need a singular FieldLocationEvent field, we need to get the one around this event where the 
+            EventSource is the same as the MousePressedEvent.
             '''
-            if event_data.get("IsPopupTrigger"):
-                '''
-                This loads all recent FieldLocationEvents that occurred within this event.
-                '''
-                field_events = load_field_location_events(buffer)
-                '''
-                Since we need a singular FieldLocationEvent field, we need to get the one where the EventSource 
-                is the same as the MousePressedEvent.
-                '''
-                field, hash_from_field = get_field_from_plugin(field_events, plugin_name)
-                tool_action = internal_plugin_to_grammar.get(
-                    plugin_name) + " : Field(" + field + ") : " + "Context Menu"
-                tool_context = internal_plugin_to_grammar.get(plugin_name) + " : Field(" + field + ")"
-                grammar_statements = self.generate_inferred_right_click_events(buffer, field, plugin_name)
-
-        if event_count == 1:
-            mouse_action = "Click"
-        elif event_count == 2:
-            mouse_action = "DoubleClick"
-        else:
-            mouse_action = "MultipleClicks"
+            field, hash_from_field = find_field_from_plugin(buffer, plugin_name)
+            tool_context = get_field_tool_context(plugin_name, field)
+            tool_action = tool_context + " : Context Menu"
+            grammar_statements = self.generate_inferred_right_click_events(buffer, tool_action)
 
         input_device = "Mouse"
-        input_action = mouse_button + " " + mouse_action
+        input_action = mouse_input_actions[mouse_button, mouse_action]
+
+        grammar_plugin = internal_plugin_to_grammar.get(plugin_name)
 
         if tool_context == "":
-            tool_context = internal_plugin_to_grammar.get(plugin_name)
+            tool_context = grammar_plugin
 
         if self.debug_:
-            print("EventName: ", event.get("Name"))
+            print("EventName: ", event.name_)
             print("PluginName:", plugin_name)
-            print("MappingToGrammar: ", internal_plugin_to_grammar.get(plugin_name))
+            print("MappingToGrammar: ", grammar_plugin)
 
-        hash_list.append(event.get("Hash"))
-        interaction.set_fragment(input_device, GRAMMAR_TYPE.INPUT_DEVICE)
-        interaction.set_fragment(input_action, GRAMMAR_TYPE.INPUT_ACTION)
-        interaction.set_fragment(tool_context, GRAMMAR_TYPE.TOOL_CONTEXT)
+        hash_list.append(event.hash_)
+        interaction.set_sentence(input_device, input_action, tool_context, tool_action)
 
         if tool_action != "":
-            interaction.set_fragment(tool_action, GRAMMAR_TYPE.ACTION)
             hash_list.append(hash_from_field)
             if self.debug_:
                 print("Tool Action Fragment: ", tool_action)
                 print("Hash List: ", hash_list)
 
-        grammar_event_core = GrammarEvent(sentence=interaction,
-                                          inferred=False,
-                                          hash_list=hash_list,
-                                          timestamp=event.get("Timestamp"),
-                                          source_event=event.get("Event"))
+        grammar_event_core = GrammarEvent(interaction, False, hash_list, event.timestamp_, event.event_)
 
-        grammar_statements.insert(0, grammar_event_core)
+        grammar_statements = (grammar_event_core,) + grammar_statements
 
         if self.debug_:
             for e in grammar_statements:
@@ -837,7 +784,7 @@ class MousePressedEvent(EventConverter):
 
         return grammar_statements
 
-    def generate_inferred_right_click_events(self, buffer: HashBuffer, field: str, plugin_name: str) -> list:
+    def generate_inferred_right_click_events(self, buffer: HashBuffer, context_menu: str) -> tuple:
         """
         This function creates inferred grammar statements that assumed a right click event occurred.
 
@@ -846,45 +793,31 @@ class MousePressedEvent(EventConverter):
 
         Args:
             @param buffer: A list-like data structure that holds instrumentation events.
-            @param field: The field that was interacted.
-            @param plugin_name: The plugin where the right-click occurred.
+            @param context_menu: Fragment of the context menu that the right-click opened on the field, which the
+            right-click statement already built.
 
-            @return list: This list must be a list of grammar events.
+            @return tuple: This must be a tuple of grammar events.
         """
 
         right_click_comment = Interaction()
         right_click_relabel = Interaction()
         event = buffer.current()
-        hash_list = [buffer.current().get("Hash")]
-
-        right_click_comment.set_fragment("Mouse", GRAMMAR_TYPE.INPUT_DEVICE)
-        right_click_comment.set_fragment("Left Click", GRAMMAR_TYPE.INPUT_ACTION)
-        right_click_comment.set_fragment(internal_plugin_to_grammar.get(plugin_name) + " : Field(" + field + ") : "
-                                         + "Context Menu" + " : " + "Set Comment...", GRAMMAR_TYPE.TOOL_CONTEXT)
-        right_click_comment.set_fragment("Open(CommentPlugin)", GRAMMAR_TYPE.ACTION)
-
-        right_click_relabel.set_fragment("Mouse", GRAMMAR_TYPE.INPUT_DEVICE)
-        right_click_relabel.set_fragment("Left Click", GRAMMAR_TYPE.INPUT_ACTION)
-        right_click_relabel.set_fragment(internal_plugin_to_grammar.get(plugin_name) + " : Field(" + field + ") : "
-                                         + "Context Menu" + " : " + "relabel", GRAMMAR_TYPE.TOOL_CONTEXT)
-        right_click_relabel.set_fragment("Open(RelabelPlugin)", GRAMMAR_TYPE.ACTION)
-
-        grammar_event_comment = GrammarEvent(sentence=right_click_comment,
-                                             inferred=True,
-                                             hash_list=hash_list,
-                                             timestamp=event.get("Timestamp"),
-                                             source_event=event.get("Event"))
-        grammar_event_relabel = GrammarEvent(sentence=right_click_relabel,
-                                             inferred=True,
-                                             hash_list=hash_list,
-                                             timestamp=event.get("Timestamp"),
-                                             source_event=event.get("Event"))
+        hash_list = [event.hash_]
+
+        right_click_comment.set_sentence("Mouse", "Left Click", context_menu + " : Set Comment...", "Open(CommentPlugin)")
+        right_click_relabel.set_sentence("Mouse", "Left Click", context_menu + " : relabel", "Open(RelabelPlugin)")
+
+        timestamp = event.timestamp_
+        source_event = event.event_
+
+        grammar_event_comment = GrammarEvent(right_click_comment, True, hash_list, timestamp, source_event)
+        grammar_event_relabel = GrammarEvent(right_click_relabel, True, hash_list, timestamp, source_event)
 
         if self.debug_:
             grammar_event_relabel.debug()
             grammar_event_comment.debug()
 
-        return [grammar_event_comment, grammar_event_relabel]
+        return grammar_event_comment, grammar_event_relabel
 
 
 class FieldInputEvent(EventConverter):
@@ -896,7 +829,7 @@ class FieldInputEvent(EventConverter):
     held (i.e. CTRL, ALT, SHIFT).
     """
 
-    def parse_event(self, buffer: HashBuffer) -> list or None:
+    def parse_event(self, buffer: HashBuffer) -> tuple or None:
         """
         Extracts relevant information from a FieldInputEvent, and constructs a grammar statement.
 
@@ -908,13 +841,13 @@ class FieldInputEvent(EventConverter):
 
         interaction = Interaction()
 
-        event_data = event.get("Data")
-        event_source = event_data.get("EventSource")
+        event_data = event.data_
+        event_source = event.source_
         is_ctrl_pressed = event_data.get("CtrlDown")
         is_shift_pressed = event_data.get("ShiftDown")
-        field = event_data.get("FieldText")
+        field = event_data["FieldText"]
         is_alt_pressed = event_data.get("AltDown")
-        hash_list = [event.get("Hash")]
+        hash_list = [event.hash_]
         '''
         An astute observer might notice that a Field Input Event also contains a variable for the Key that was pressed
         which is already represented by a char. The problem with this variable is that keys pressed in conjunction with 
@@ -925,45 +858,30 @@ class FieldInputEvent(EventConverter):
         environment. 
         '''
         key_code = event_data.get("KeyCode")
-        key_pressed = keyboard_scan_code_mapping.get(key_code)
+        key_pressed = keyboard_scan_code_names.get(key_code)
 
         if key_pressed is None:
             return None
 
-        keys_pressed = ""
-
-        if is_ctrl_pressed is True:
-            keys_pressed += "CTRL "
-        if is_shift_pressed is True:
-            keys_pressed += "SHIFT "
-        if is_alt_pressed is True:
-            keys_pressed += "ALT "
-
-        keys_pressed += str(key_pressed.value) + " "
+        modifiers = (is_ctrl_pressed is True) | (is_shift_pressed is True) << 1 | (is_alt_pressed is True) << 2
 
         input_device = "Keyboard"
-        input_action = keys_pressed
-        tool_context = internal_plugin_to_grammar.get(event_source) + " : " + "Field(" + field + ")"
+        input_action = f"{modifier_prefixes[modifiers]}{key_pressed} "
+        tool_context = get_field_tool_context(event_source, field)
 
         if self.debug_:
-            print("SourceEvent: ", event.get("Name"))
+            print("SourceEvent: ", event.name_)
             print("PluginName:", event_source)
-            print("MappingToGrammar: ", internal_plugin_to_grammar(event_source))
+            print("MappingToGrammar: ", internal_plugin_to_grammar.get(event_source))
 
-        interaction.set_fragment(input_device, GRAMMAR_TYPE.INPUT_DEVICE)
-        interaction.set_fragment(input_action, GRAMMAR_TYPE.INPUT_ACTION)
-        interaction.set_fragment(tool_context, GRAMMAR_TYPE.TOOL_CONTEXT)
+        interaction.set_sentence(input_device, input_action, tool_context)
 
-        grammar_event = GrammarEvent(sentence=interaction,
-                                     inferred=False,
-                                     hash_list=hash_list,
-                                     timestamp=event.get("Timestamp"),
-                                     source_event=event.get("Event"))
+        grammar_event = GrammarEvent(interaction, False, hash_list, event.timestamp_, event.event_)
 
         if self.debug_:
             grammar_event.debug()
 
-        return [grammar_event]
+        return (grammar_event,)
 
 
 class GhidraProgramActivatedEvent(EventConverter):
@@ -978,7 +896,7 @@ class GhidraProgramActivatedEvent(EventConverter):
     platform if the user clicked on the program tabs inside the Listing Panel.
     """
 
-    def parse_event(self, buffer: HashBuffer) -> list or None:
+    def parse_event(self, buffer: HashBuffer) -> tuple or None:
         """
         Extracts relevant information from a GhidraProgramActivatedEvent and creates a grammar statement.
 
@@ -989,7 +907,7 @@ class GhidraProgramActivatedEvent(EventConverter):
 
         interaction = Interaction()
 
-        event_data = event.get("Data")
+        event_data = event.data_
         program_name = event_data.get("ProgramName")
 
         if program_name is None:
@@ -1000,56 +918,47 @@ class GhidraProgramActivatedEvent(EventConverter):
         if input_device is None:
             return self.inferred_program_activated_events(buffer, )
 
-        tool_context = "CodeBrowser" + " : " + " ProgramTab(" + "\"" + program_name + "\"" + ")"
-        tool_action = "Ghidra load \"" + program_name + "\""
+        tool_context = f'CodeBrowser :  ProgramTab("{program_name}")'
+        tool_action = f'Ghidra load "{program_name}"'
 
         interaction.set_sentence(input_device, input_action, tool_context, tool_action)
-        hash_list.insert(0, event.get("Hash"))
+        hash_list.insert(0, event.hash_)
 
-        grammar_event = GrammarEvent(sentence=interaction,
-                                     inferred=False,
-                                     hash_list=hash_list,
-                                     timestamp=event.get("Timestamp"),
-                                     source_event=event.get("Event"))
+        grammar_event = GrammarEvent(interaction, False, hash_list, event.timestamp_, event.event_)
 
         if self.debug_:
             grammar_event.debug()
 
-        return [grammar_event]
+        return (grammar_event,)
 
-    def inferred_program_activated_events(self, buffer: HashBuffer) -> list:
+    def inferred_program_activated_events(self, buffer: HashBuffer) -> tuple:
 
-        program_name = buffer.current().get("Data").get("ProgramName")
+        event = buffer.current()
+        program_name = event.data_.get("ProgramName")
         inferred_left_click = Interaction()
         inferred_middle_click = Interaction()
         input_device = "Mouse"
         input_action_left = "Left Click"
         input_action_middle = "Middle Click"
-        tool_context = "CodeBrowser" + " : " + " ProgramTab(" + "\"" + program_name + "\"" + ")"
-        tool_action = "Ghidra load \"" + program_name + "\""
+        tool_context = f'CodeBrowser :  ProgramTab("{program_name}")'
+        tool_action = f'Ghidra load "{program_name}"'
 
         inferred_left_click.set_sentence(input_device, input_action_left, tool_context, tool_action)
         inferred_middle_click.set_sentence(input_device, input_action_middle, tool_context, tool_action)
 
-        hash_list = [buffer.current().get("Hash")]
-        event = buffer.current()
+        hash_list = [event.hash_]
 
-        grammar_event_left = GrammarEvent(sentence=inferred_left_click,
-                                          inferred=True,
-                                          hash_list=hash_list,
-                                          timestamp=event.get("Timestamp"),
-                                          source_event=event.get("Event"))
-        grammar_event_middle = GrammarEvent(sentence=inferred_middle_click,
-                                            inferred=True,
-                                            hash_list=hash_list,
-                                            timestamp=event.get("Timestamp"),
-                                            source_event=event.get("Event"))
+        timestamp = event.timestamp_
+        source_event = event.event_
+
+        grammar_event_left = GrammarEvent(inferred_left_click, True, hash_list, timestamp, source_event)
+        grammar_event_middle = GrammarEvent(inferred_middle_click, True, hash_list, timestamp, source_event)
 
         if self.debug_:
             grammar_event_middle.debug()
             grammar_event_left.debug()
 
-        return [grammar_event_left, grammar_event_middle]
+        return grammar_event_left, grammar_event_middle
 
 
 # TODO Function Graph vertex click events might act different than expected. Need to double check on VM. Disabling event converter for now.
@@ -1062,7 +971,7 @@ class FunctionGraphVertexClickEvent(EventConverter):
     the json event we can't tell which one occurred. So we leave the event with an ambiguous Input device action.
     """
 
-    def parse_event(self, buffer: HashBuffer) -> list or None:
+    def parse_event(self, buffer: HashBuffer) -> tuple or None:
         """
         Extracts relevant information from a FunctionGraphVertexClickEvent and constructs a grammar statement.
 
@@ -1076,77 +985,61 @@ class FunctionGraphVertexClickEvent(EventConverter):
             return self.inferred_function_graph_vertex_click_events(buffer)
 
         event = buffer.current()
-        event_count = event.get("Data").get("MouseClickCount")
-        hash_list.insert(0, event.get("Hash"))
+        event_count = event.data_.get("MouseClickCount")
+        hash_list.insert(0, event.hash_)
 
-        if event_count == 1:
-            mouse_action = "Click"
-        elif event_count == 2:
-            mouse_action = "DoubleClick"
-        else:
-            mouse_action = "MultipleClicks"
+        mouse_action = field_click_counts.get(event_count, "MultipleClicks")
 
         interaction = Interaction()
 
-        event_data = event.get("Data")
+        event_data = event.data_
         vertex_title = event_data.get("VertexTitle")
-        event_source = event_data.get("EventSource")
+        event_source = event.source_
 
-        tool_context = internal_plugin_to_grammar.get(event_source) + " : " + "Vertex(" + vertex_title + ")"
-        tool_action = internal_plugin_to_grammar.get(event_source) + " : " + "SelectionChanged : " + \
-                      "Vertex(" + vertex_title + ")"
+        grammar_plugin = internal_plugin_to_grammar.get(event_source)
+        tool_context = grammar_plugin + " : " + "Vertex(" + vertex_title + ")"
+        tool_action = grammar_plugin + " : " + "SelectionChanged : " + "Vertex(" + vertex_title + ")"
 
         if self.debug_:
             print("PluginName:", event_source)
-            print("MappingToGrammar: ", internal_plugin_to_grammar.get(event_source))
+            print("MappingToGrammar: ", grammar_plugin)
 
         interaction.set_sentence(input_device, input_action + " " + mouse_action, tool_context, tool_action)
 
-        grammar_event = GrammarEvent(sentence=interaction,
-                                     inferred=False,
-                                     hash_list=hash_list,
-                                     timestamp=event.get("Timestamp"),
-                                     source_event=event.get("Event"))
+        grammar_event = GrammarEvent(interaction, False, hash_list, event.timestamp_, event.event_)
 
         if self.debug_:
             grammar_event.debug()
 
-        return [grammar_event]
+        return (grammar_event,)
 
     # TODO: Make sure the middle click tool_action fragment is the same as the left click.
-    def inferred_function_graph_vertex_click_events(self, buffer: HashBuffer) -> list:
+    def inferred_function_graph_vertex_click_events(self, buffer: HashBuffer) -> tuple:
 
         event = buffer.current()
-        event_data = event.get("Data")
+        event_data = event.data_
         vertex_title = event_data.get("VertexTitle")
-        event_source = event_data.get("EventSource")
+        event_source = event.source_
 
         inferred_left_click = Interaction()
         inferred_middle_click = Interaction()
-        hash_list = [event.get("Hash")]
+        hash_list = [event.hash_]
+
+        grammar_plugin = internal_plugin_to_grammar.get(event_source)
+        tool_context = grammar_plugin + " : " + "Vertex(" + vertex_title + ")"
+        tool_action = grammar_plugin + " : " + "SelectionChanged : " + "Vertex(" + vertex_title + ")"
 
-        tool_context = internal_plugin_to_grammar.get(event_source) + " : " + "Vertex(" + vertex_title + ")"
+        inferred_left_click.set_sentence("Mouse", "Left Click", tool_context, tool_action)
+        inferred_middle_click.set_sentence("Mouse", "Middle Click", tool_context, tool_action)
 
-        inferred_left_click.set_sentence("Mouse", "Left Click", tool_context,
-                                         internal_plugin_to_grammar.get(event_source) + " : " +
-                                         "SelectionChanged : " + "Vertex(" + vertex_title + ")")
-        inferred_middle_click.set_sentence("Mouse", "Middle Click", tool_context,
-                                           internal_plugin_to_grammar.get(event_source) + " : " +
-                                           "SelectionChanged : " + "Vertex(" + vertex_title + ")")
+        timestamp = event.timestamp_
+        source_event = event.event_
 
-        grammar_event_left = GrammarEvent(sentence=inferred_left_click,
-                                          inferred=True,
-                                          hash_list=hash_list,
-                                          timestamp=event.get("Timestamp"),
-                                          source_event=event.get("Event"))
+        grammar_event_left = GrammarEvent(inferred_left_click, True, hash_list, timestamp, source_event)
 
-        grammar_event_middle = GrammarEvent(sentence=inferred_middle_click,
-                                            inferred=True,
-                                            hash_list=hash_list,
-                                            timestamp=event.get("Timestamp"),
-                                            source_event=event.get("Event"))
+        grammar_event_middle = GrammarEvent(inferred_middle_click, True, hash_list, timestamp, source_event)
 
-        return [grammar_event_left, grammar_event_middle]
+        return grammar_event_left, grammar_event_middle
 
 
 class FunctionGraphEdgePickEvent(EventConverter):
@@ -1189,16 +1082,16 @@ class FunctionGraphEdgePickEvent(EventConverter):
 
         input_device = "Mouse"
         input_action = "Left" + " *(Click | DoubleClick | MultipleClicks)"
-        tool_context = internal_plugin_to_grammar.get(
-            event_source) + " : " + "Edge(" + starting_address + ", " + ending_address + ")"
+        grammar_plugin = internal_plugin_to_grammar.get(event_source)
+        tool_context = grammar_plugin + " : " + "Edge(" + starting_address + ", " + ending_address + ")"
 
         if self.debug_:
             print("PluginName:", event_source)
-            print("MappingToGrammar: ", internal_plugin_to_grammar(event_source))
+            print("MappingToGrammar: ", grammar_plugin)
 
-        interaction.set_fragment(input_device, GRAMMAR_TYPE.INPUT_DEVICE)
-        interaction.set_fragment(input_action, GRAMMAR_TYPE.INPUT_ACTION)
-        interaction.set_fragment(tool_context, GRAMMAR_TYPE.TOOL_CONTEXT)
+        interaction.set_fragment(input_device, _INPUT_DEVICE)
+        interaction.set_fragment(input_action, _INPUT_ACTION)
+        interaction.set_fragment(tool_context, _TOOL_CONTEXT)
 
         return interaction
 
@@ -1215,7 +1108,7 @@ class VerticalScrollbarAdjustmentEvent(EventConverter):
     occurred due to some interaction not involving the scroll bar.
     """
 
-    def parse_event(self, buffer: HashBuffer) -> list or None:
+    def parse_event(self, buffer: HashBuffer) -> tuple or None:
         """
         Constructs a grammar statement based on all vertical scroll bar events that passed a heuristic we defined.
         This function then consumes all events that were used by the grammar statement.
@@ -1227,11 +1120,12 @@ class VerticalScrollbarAdjustmentEvent(EventConverter):
         '''
         An scroll bar event can be consumed by a previous scroll bar event.
         '''
-        if buffer.current().get("Consumed"):
+        event = buffer.current()
+
+        if event.consumed_:
             return None
 
-        event = buffer.current()
-        event_data = event.get("Data")
+        event_data = event.data_
 
         last_scroll_event, hash_list = self.consume_scroll_events(buffer)
 
@@ -1239,19 +1133,17 @@ class VerticalScrollbarAdjustmentEvent(EventConverter):
             print("[INFO] Hash List less than 2, assuming ghidra event generated. Skipping...")
             return None
 
-        hash_list.insert(0, event.get("Hash"))
+        hash_list.insert(0, event.hash_)
 
-        tool_context = internal_plugin_to_grammar.get(event_data.get("EventSource")) + " : " + "ScrollbarLocation" + \
-                       "[" + str(event_data.get("ScrollbarLocation")) + "]"
+        grammar_plugin = internal_plugin_to_grammar.get(event.source_)
+        tool_context = grammar_plugin + f" : ScrollbarLocation[{event_data.get('ScrollbarLocation')}]"
 
-        tool_action_scroll_position = "ScrollbarLocation" + "[" + \
-                                      str(last_scroll_event.get("Data").get("ScrollbarLocation")) + "]"
-        tool_action = internal_plugin_to_grammar.get(
-            event_data.get("EventSource")) + " : " + tool_action_scroll_position
+        tool_action_scroll_position = f"ScrollbarLocation[{last_scroll_event.data_.get('ScrollbarLocation')}]"
+        tool_action = grammar_plugin + " : " + tool_action_scroll_position
 
         return self.generate_inferred_statements(event, tool_context, tool_action, hash_list)
 
-    def generate_inferred_statements(self, event: dict, tool_context: str, tool_action: str, hash_list: list):
+    def generate_inferred_statements(self, event: BufferEvent, tool_context: str, tool_action: str, hash_list: list):
 
         inferred_drag = Interaction()
         inferred_left_click = Interaction()
@@ -1263,34 +1155,23 @@ class VerticalScrollbarAdjustmentEvent(EventConverter):
         inferred_mouse_wheel_up.set_sentence("Mouse", "MouseWheel Up", tool_context, tool_action)
         inferred_mouse_wheel_down.set_sentence("Mouse", "MouseWheel Down", tool_context, tool_action)
 
-        grammar_event_drag = GrammarEvent(sentence=inferred_drag,
-                                          inferred=True,
-                                          hash_list=hash_list,
-                                          timestamp=event.get("Timestamp"),
-                                          source_event=event.get("Event"))
-
-        grammar_event_left_click = GrammarEvent(sentence=inferred_left_click,
-                                                inferred=True,
-                                                hash_list=hash_list,
-                                                timestamp=event.get("Timestamp"),
-                                                source_event=event.get("Event"))
-
-        grammar_event_mouse_wheel_down = GrammarEvent(sentence=inferred_mouse_wheel_down,
-                                                      inferred=True,
-                                                      hash_list=hash_list,
-                                                      timestamp=event.get("Timestamp"),
-                                                      source_event=event.get("Event"))
-
-        grammar_event_mouse_wheel_up = GrammarEvent(sentence=inferred_mouse_wheel_up,
-                                                    inferred=True,
-                                                    hash_list=hash_list,
-                                                    timestamp=event.get("Timestamp"),
-                                                    source_event=event.get("Event"))
-
-        return [grammar_event_left_click, grammar_event_mouse_wheel_up, grammar_event_mouse_wheel_down,
-                grammar_event_drag]
-
-    def consume_scroll_events(self, buffer: HashBuffer) -> (dict, list):
+        # All four inferred statements share the scroll event's timestamp and source
+        timestamp = event.timestamp_
+        source_event = event.event_
+
+        grammar_event_drag = GrammarEvent(inferred_drag, True, hash_list, timestamp, source_event)
+
+        grammar_event_left_click = GrammarEvent(inferred_left_click, True, hash_list, timestamp, source_event)
+
+        grammar_event_mouse_wheel_down = GrammarEvent(inferred_mouse_wheel_down, True, hash_list, timestamp,
+                                                      source_event)
+
+        grammar_event_mouse_wheel_up = GrammarEvent(inferred_mouse_wheel_up, True, hash_list, timestamp, source_event)
+
+        return (grammar_event_left_click, grammar_event_mouse_wheel_up, grammar_event_mouse_wheel_down,
+                grammar_event_drag)
+
+    def consume_scroll_events(self, buffer: HashBuffer) -> (BufferEvent, list):
         """
         This functions returns all scroll events that meet the following criteria.
 
@@ -1309,31 +1190,41 @@ class VerticalScrollbarAdjustmentEvent(EventConverter):
         index = buffer.get_index()
         event_frame = buffer.get_event_list()
         hash_list = []
+        add_hash = hash_list.append
+        debug = self.debug_
+
+        '''
+        Only events from the same source as the initial scroll event are chained, so its source and the time of the last
+        chained event are all that is needed from the previous event.
+        '''
+        event_source = last_scroll_event.source_
+        last_scroll_event_time = last_scroll_event.timestamp_
+        timestamps = buffer.get_timestamps()
 
-        for i in range(index + 1, len(event_frame)):
+        # Other events never end the chain, so only the scroll bar events after the initial one are visited
+        for i in buffer.iter_after("VerticalScrollbarAdjustmentEvent", index):
 
             event = event_frame[i]
 
-            if event.get("Name") == "VerticalScrollbarAdjustmentEvent":
-                if event.get("Data").get("EventSource") == last_scroll_event.get("Data").get("EventSource"):
+            if event.source_ == event_source:
 
-                    last_scroll_event_time = last_scroll_event.get("Timestamp")
-                    curr_scroll_event_time = event.get("Timestamp")
+                curr_scroll_event_time = timestamps[i]
 
-                    time_diff = curr_scroll_event_time - last_scroll_event_time
+                time_diff = curr_scroll_event_time - last_scroll_event_time
 
-                    if self.debug_:
-                        print("[DEBUG] Event being Checked: ", event)
-                        print("[DEBUG] Time Difference: ", time_diff)
+                if debug:
+                    print("[DEBUG] Event being Checked: ", event)
+                    print("[DEBUG] Time Difference: ", time_diff)
 
-                    if time_diff < 5.0:
-                        if self.debug_:
-                            print("Event was consumed! Number of events consumed: ", len(hash_list) + 1)
-                        event["Consumed"] = True
-                        hash_list.append(event.get("Hash"))
-                        last_scroll_event = event
-                    else:
-                        return last_scroll_event, hash_list
+                if time_diff < 5.0:
+                    if debug:
+                        print("Event was consumed! Number of events consumed: ", len(hash_list) + 1)
+                    event.consumed_ = True
+                    add_hash(event.hash_)
+                    last_scroll_event = event
+                    last_scroll_event_time = curr_scroll_event_time
+                else:
+                    return last_scroll_event, hash_list
 
         return last_scroll_event, hash_list
 
@@ -1342,22 +1233,21 @@ class VerticalScrollbarAdjustmentEvent(EventConverter):
         event_list = buffer.get_event_list()
         index = buffer.get_index()
 
-        for i in reversed(range(index)):
+        # Walks back through the mouse events only, starting with the one closest to the scroll event
+        for i in buffer.iter_before("MouseEvent", index):
 
             event = event_list[i]
-
-            if event.get("Name") == "MouseEvent":
-                mouse_event_data = event.get("Data")
-
-                if mouse_event_data.get("EventName") == "MOVE":
-                    return "Mouse", "Drag", event.get("Hash")
-                if mouse_event_data.get("EventName") == "CLICK":
-                    return "Mouse", "Left Click", event.get("Hash")
-                if mouse_event_data.get("EventName") == "SCROLL":
-                    mouse_wheel_dir = mouse_event_data.get("Direction")
-                    mouse_wheel_dir = mouse_wheel_dir.lower()
-                    mouse_wheel_dir = mouse_wheel_dir.capitalize()
-                    return "Mouse", "MouseWheel " + mouse_wheel_dir, event.get("Hash")
+            mouse_event_data = event.data_
+            mouse_event_name = mouse_event_data.get("EventName")
+            input_action = scroll_input_actions.get(mouse_event_name)
+
+            if input_action is not None:
+                return "Mouse", input_action, event.hash_
+            if mouse_event_name == "SCROLL":
+                mouse_wheel_dir = mouse_event_data.get("Direction")
+                mouse_wheel_dir = mouse_wheel_dir.lower()
+                mouse_wheel_dir = mouse_wheel_dir.capitalize()
+                return "Mouse", "MouseWheel " + mouse_wheel_dir, event.hash_
 
         return "Mouse", "Drag", None
 
@@ -1406,20 +1296,17 @@ class VerticalScrollbarAdjustmentEvent(EventConverter):
         return "ScrollLocation" + "[" + str(prev_scroll_event_position) + "]"
 
 
-class MouseEnteredEvent(EventConverter):
+class PluginMoveEvent(EventConverter):
     """
-    This class takes a MouseEnteredEvent and converts it to a grammar statement.
-
-    This event is generated by internal Ghidra instrumentation. This means that if a plugin isn't instrumented, it won't
-    generate MouseEnteredEvents.
-
-    Something to note is that for a lot of cases, that this will generate the same grammar statement as some
-    WindowEvents.
+    Base class for the internal Ghidra events that only record the mouse moving in or out of a plugin. The grammar 
+    statements of these events differ only in their input action, which each child class sets in input_action_.
     """
 
-    def parse_event(self, buffer: HashBuffer) -> list or None:
+    input_action_ = ""
+
+    def parse_event(self, buffer: HashBuffer) -> tuple or None:
         """
-        Constructs a grammar statement from a MouseEnteredEvent.
+        Constructs a grammar statement from the event, with the input action of the child class.
 
         Args:
             @param buffer: list-like data structure that holds instrumentation events.
@@ -1427,32 +1314,38 @@ class MouseEnteredEvent(EventConverter):
 
         event = buffer.current()
         interaction = Interaction()
-        event_data = event.get("Data")
-        plugin_name = event_data.get("EventSource")
-        hash_list = [event.get("Hash")]
+        plugin_name = event.source_
+        hash_list = [event.hash_]
 
         input_device = "Mouse"
-        input_action = "Move : Enter"
         tool_context = internal_plugin_to_grammar.get(plugin_name)
 
         if self.debug_:
             print("PluginName:", plugin_name)
-            print("MappingToGrammar: ", internal_plugin_to_grammar.get(plugin_name))
+            print("MappingToGrammar: ", tool_context)
+
+        interaction.set_sentence(input_device, self.input_action_, tool_context)
+
+        grammar_event = GrammarEvent(interaction, False, hash_list, event.timestamp_, event.event_)
 
-        interaction.set_fragment(input_device, GRAMMAR_TYPE.INPUT_DEVICE)
-        interaction.set_fragment(input_action, GRAMMAR_TYPE.INPUT_ACTION)
-        interaction.set_fragment(tool_context, GRAMMAR_TYPE.TOOL_CONTEXT)
+        return (grammar_event,)
 
-        grammar_event = GrammarEvent(sentence=interaction,
-                                     inferred=False,
-                                     hash_list=hash_list,
-                                     timestamp=event.get("Timestamp"),
-                                     source_event=event.get("Event"))
 
-        return [grammar_event]
+class MouseEnteredEvent(PluginMoveEvent):
+    """
+    This class takes a MouseEnteredEvent and converts it to a grammar statement.
+
+    This event is generated by internal Ghidra instrumentation. This means that if a plugin isn't instrumented, it won't
+    generate MouseEnteredEvents.
+
+    Something to note is that for a lot of cases, that this will generate the same grammar statement as some
+    WindowEvents.
+    """
 
+    input_action_ = "Move : Enter"
 
-class MouseExitedEvent(EventConverter):
+
+class MouseExitedEvent(PluginMoveEvent):
     """
     This class takes a MouseExitedEvent and converts it to a grammar statement.
 
@@ -1463,39 +1356,38 @@ class MouseExitedEvent(EventConverter):
     WindowEvents.
     """
 
-    def parse_event(self, buffer: HashBuffer) -> list or None:
-        """
-        Constructs a grammar statement based on MouseExitedEvent
+    input_action_ = "Move : Exit"
 
-        Args:
-            @param buffer: list-like data structure that holds instrumentation events
-        """
-
-        event = buffer.current()
-        interaction = Interaction()
-        event_data = event.get("Data")
-        plugin_name = event_data.get("EventSource")
-        hash_list = [event.get("Hash")]
 
-        input_device = "Mouse"
-        input_action = "Move : Exit"
-        tool_context = internal_plugin_to_grammar.get(plugin_name)
+def get_field_location_bounds(buffer: HashBuffer) -> (int, int):
+    """
+    Returns the start and end positions of the "bubble" of events around the current event in which its 
+    FieldLocationEvents can occur.
 
-        if self.debug_:
-            print("PluginName:", plugin_name)
-            print("MappingToGrammar: ", internal_plugin_to_grammar.get(plugin_name))
+    @param buffer: HashBuffer data structure that contains instrumentation events
+    """
 
-        interaction.set_fragment(input_device, GRAMMAR_TYPE.INPUT_DEVICE)
-        interaction.set_fragment(input_action, GRAMMAR_TYPE.INPUT_ACTION)
-        interaction.set_fragment(tool_context, GRAMMAR_TYPE.TOOL_CONTEXT)
+    source_event_time = buffer.current().timestamp_
+    index = buffer.get_index()
+    event_list = buffer.get_event_list()
+    timestamps = buffer.get_timestamps()
+    '''
+    The bubble ends, on either side, at the first event other than a FieldLocationEvent that is more than 1.5 secs 
+    away. Events are not strictly in time order, so each event is checked in turn from the current one outward.
+    '''
+    start = 0
+    for i in reversed(range(index)):
+        if event_list[i].name_ != "FieldLocationEvent" and source_event_time - timestamps[i] > 1.5:
+            start = i + 1
+            break
 
-        grammar_event = GrammarEvent(sentence=interaction,
-                                     inferred=False,
-                                     hash_list=hash_list,
-                                     timestamp=event.get("Timestamp"),
-                                     source_event=event.get("Event"))
+    end = len(event_list)
+    for i in range(index + 1, len(event_list)):
+        if event_list[i].name_ != "FieldLocationEvent" and timestamps[i] - source_event_time > 1.5:
+            end = i
+            break
 
-        return [grammar_event]
+    return start, end
 
 
 def load_field_location_events(buffer: HashBuffer) -> list:
@@ -1506,93 +1398,81 @@ def load_field_location_events(buffer: HashBuffer) -> list:
     @param buffer: HashBuffer data structure that contains instrumentation events
     """
 
-    field_location_events = []
-    source_event_time = buffer.current().get("Timestamp")
     index = buffer.get_index()
     event_list = buffer.get_event_list()
     '''
     We consider both directions of event_frame since field location events can occur within a 
     "bubble" surrounding the source event.
     '''
-    for i in range(index + 1, len(event_list)):
-
-        event = event_list[i]
-
-        if event.get("Name") == "FieldLocationEvent":
-
-            field_location_events.append(event)
-
-        else:
-
-            curr_event_time = event.get("Timestamp")
-
-            diff = curr_event_time - source_event_time
-
-            if diff > 1.5:
-                break
-
-    for i in reversed(range(index)):
+    start, end = get_field_location_bounds(buffer)
 
-        event = event_list[i]
+    # The FieldLocationEvents in the bubble are read off the buffer's positions of them, not picked out of every event
+    return [event_list[i] for i in buffer.iter_between("FieldLocationEvent", start, end) if i != index]
 
-        if event.get("Name") == "FieldLocationEvent":
 
-            field_location_events.insert(0, event)
+def find_field_from_plugin(buffer: HashBuffer, plugin_name) -> (str, str):
+    """
+    Returns the field-text value and hash of the FieldLocationEvent that occurred in the given plugin within the 
+    bubble of the current event, looked up in the buffer's index of FieldLocationEvents by plugin.
 
-        else:
+    @param buffer: HashBuffer data structure that contains instrumentation events
+    @param plugin_name: EventSource the FieldLocationEvent must come from
+    """
 
-            curr_event_time = event.get("Timestamp")
+    start, end = get_field_location_bounds(buffer)
+    field_positions = buffer.get_field_positions(plugin_name)
+    '''
+    The earliest event of the plugin inside the bubble is the one we want. That prefers events before the source 
+    event over events after it, and the source event itself is never a FieldLocationEvent.
+    '''
+    i = bisect_left(field_positions, start)
 
-            diff = source_event_time - curr_event_time
+    if i == len(field_positions) or field_positions[i] >= end:
+        '''
+        This is possible in certain situations but for the most time it shouldn't.
+        '''
+        return "*(unknown)", ""
 
-            if diff > 1.5:
-                break
+    field_event = buffer.get_event_list()[field_positions[i]]
 
-    return field_location_events
+    # field_event.consumed_ = True
+    return field_event.data_["FieldText"], field_event.hash_
 
 
-def get_field_from_plugin(field_events, plugin_name) -> (str, str):
-    """
-    Given a list of FieldLocationEvents, this function then returns the field-text value of the
-    FieldLocationEvent that occurred in the given plugin.
+@lru_cache(maxsize=4096)
+def get_field_tool_context(plugin_name, field) -> str:
     """
+    Returns the tool context fragment for a field inside a plugin. Traces keep interacting with the same fields, so the
+    fragments are cached instead of being rebuilt for every event.
 
-    for event in field_events:
-
-        event_data = event.get("Data")
-        event_source = event_data.get("EventSource")
-
-        if event_source == plugin_name:
-            # event["Consumed"] = True
-            return event_data.get("FieldText"), event.get("Hash")
+    @param plugin_name: Internal name of the plugin the field belongs to.
+    @param field: Text of the field.
+    """
 
-    '''
-    This is possible in certain situations but for the most time it shouldn't.
-    '''
-    return "*(unknown)", ""
+    return internal_plugin_to_grammar.get(plugin_name) + " : Field(" + field + ")"
 
 
 def get_input_fragments(buffer: HashBuffer) -> (str, str, list) or (None, None, None):
-    src_timestamp = buffer.current().get("Timestamp")
+    src_timestamp = buffer.current().timestamp_
     event_list = buffer.get_event_list()
     index = buffer.get_index()
 
-    for i in reversed(range(index)):
-        if event_list[i].get("Name") == "MouseEvent":
-            curr_timestamp = event_list[i].get("Timestamp")
-            diff = src_timestamp - curr_timestamp
-            if diff > 1:
-                return None, None, None
-            elif event_list[i].get("Data").get("EventName") == "CLICK":
-                mouse_event = event_list[i]
-                mouse_data = mouse_event.get("Data")
-                mouse_button = mouse_data.get("Button")
-                mouse_button = mouse_button.lower()
-                mouse_button = mouse_button.capitalize()
-                input_device = "Mouse"
-                input_action = mouse_button
-                hash_list = [mouse_event.get("Hash")]
-
-                return input_device, input_action, hash_list
+    # Only MouseEvents are looked at, so the walk back goes straight from one MouseEvent to the previous one
+    for i in buffer.iter_before("MouseEvent", index):
+        curr_timestamp = event_list[i].timestamp_
+        diff = src_timestamp - curr_timestamp
+        if diff > 1:
+            return None, None, None
+        elif event_list[i].data_.get("EventName") == "CLICK":
+            mouse_event = event_list[i]
+            mouse_data = mouse_event.data_
+            mouse_button = mouse_data.get("Button")
+            mouse_button = mouse_button.lower()
+            mouse_button = mouse_button.capitalize()
+            input_device = "Mouse"
+            input_action = mouse_button
+            hash_list = [mouse_event.hash_]
+
+            return input_device, input_action, hash_list
 
     return None, None, None
@@ -10,6 +10,13 @@ Description:
 import json
 from enum import Enum, auto
 
+# orjson is an optional C extension that decodes event data considerably faster than the standard library. Both accept
+# bytes, so input files can be read in binary mode either way.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 
 class GRAMMAR_TYPE(Enum):
     UNHANDLED = auto()
@@ -20,15 +27,6 @@ class GRAMMAR_TYPE(Enum):
     ACTION = auto()
 
 
-def generate_output_file(grammar_statements, outputfile):
-    output = open(outputfile, "a")
-
-    for element in grammar_statements:
-        output.write(str(element) + '\n')
-
-    output.close()
-
-
 internal_plugin_to_grammar = {
     'CavaCodeBrowserPlugin': "CodeBrowser : ListingView",
     'CavaDecompilePlugin': 'Decompiler',
@@ -541,3 +539,28 @@ charMapping = {
     'KEY_Y': 'y',
     'KEY_Z': 'z'
 }
+
+# Name of the key of each scan code, so converters don't go through the KeyboardKey members for every key press
+keyboard_scan_code_names = {scan_code: key.value for scan_code, key in keyboard_scan_code_mapping.items()}
+
+# Keys that remove the last typed character instead of adding one
+erase_keys = frozenset((KeyboardKey.KEY_BACKSPACE.value, KeyboardKey.KEY_DELETE.value))
+
+# Names of the MouseButton and ClickCount values of FieldMouseEvents and MousePressedEvents. Any other button is a right
+# click and any other count is multiple clicks.
+field_mouse_buttons = {1: "Left", 2: "Middle"}
+field_click_counts = {1: "Click", 2: "DoubleClick"}
+
+# Input action of a WindowEvent or HeaderEvent click type. Any other event type is a mouse move.
+window_click_actions = {"LeftClick": "Left Click", "RightClick": "Right Click", "MiddleClick": "Middle PressDown"}
+
+# Input action fragment of every mouse button and click count name, built once so events share the same strings
+mouse_input_actions = {(button, action): button + " " + action
+                       for button in (*field_mouse_buttons.values(), "Right")
+                       for action in (*field_click_counts.values(), "MultipleClicks")}
+
+# Input action of the mouse event that led to a scrollbar adjustment. Mouse wheel scrolls also depend on the direction.
+scroll_input_actions = {"MOVE": "Drag", "CLICK": "Left Click"}
+
+# Modifier prefix of a FieldInputEvent input action, indexed by CTRL | SHIFT << 1 | ALT << 2
+modifier_prefixes = ("", "CTRL ", "SHIFT ", "CTRL SHIFT ", "ALT ", "CTRL ALT ", "SHIFT ALT ", "CTRL SHIFT ALT ")
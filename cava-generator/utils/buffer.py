@@ -21,7 +21,7 @@ def get_frame(event_list, start, frame_size, res):
 def find_last_frame_event(event_list, start, frame_size) -> int:
 
     initial_event = event_list[start][0]
-    initial_event_name = list(initial_event.keys())[0]
+    initial_event_name = next(iter(initial_event))
     initial_time = initial_event.get(initial_event_name).get("Timestamp")
 
     end_time = initial_time + frame_size
@@ -32,7 +32,7 @@ def find_last_frame_event(event_list, start, frame_size) -> int:
     for index in range(start+1, len(event_list)):
 
         event = event_list[index][0]
-        event_name = list(event.keys())[0]
+        event_name = next(iter(event))
         curr_time = event.get(event_name).get("Timestamp")
 
         if curr_time < end_time:
@@ -49,7 +49,7 @@ def find_first_frame_event(event_list, start, res) -> int:
         return start
 
     first_new_event = event_list[start][0]
-    first_new_event_name = list(first_new_event.keys())[0]
+    first_new_event_name = next(iter(first_new_event))
     time = first_new_event.get(first_new_event_name).get("Timestamp")
 
     new_start_time = time - res
@@ -57,7 +57,7 @@ def find_first_frame_event(event_list, start, res) -> int:
     for index in reversed(range(start+1)):
 
         event = event_list[index][0]
-        event_name = list(event.keys())[0]
+        event_name = next(iter(event))
         curr_time = event.get(event_name).get("Timestamp")
 
         if curr_time < new_start_time:
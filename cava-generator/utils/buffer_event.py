@@ -0,0 +1,61 @@
+"""
+File:    buffer_event.py
+Author:  Froylan Maldonado
+Email:   froylan.g.maldonado.civ@us.navy.mil
+Created: September 2024
+Description:
+    Instrumentation event as it is held in the HashBuffer. The fields converters read on every event are
+    pulled out of the json object once, when the event is added to the buffer.
+"""
+
+import hashlib
+from functools import partial
+
+# The hashes only identify events, so md5 is requested as not being used for security. That keeps it usable on FIPS
+# builds of OpenSSL. The argument only exists since Python 3.9.
+try:
+    md5 = partial(hashlib.md5, usedforsecurity=False)
+    md5()
+except TypeError:
+    md5 = hashlib.md5
+
+
+class BufferEvent:
+    __slots__ = ('name_', 'data_', 'timestamp_', 'source_', 'event_hash_', 'consumed_')
+
+    def __init__(self, name: str, data: dict, timestamp: float, source: str):
+        self.name_ = name
+        self.data_ = data
+        self.timestamp_ = timestamp
+        self.source_ = source
+        self.event_hash_ = None
+        self.consumed_ = False
+
+    @property
+    def event_(self) -> dict:
+        """
+        The json event this was created from. Events hold nothing but their data under their name, so it is rebuilt from 
+        those two rather than kept alive next to them.
+        """
+
+        return {self.name_: self.data_}
+
+    @property
+    def hash_(self) -> str:
+        """
+        md5 of the json event. Only events that end up in a grammar statement are ever hashed, so it is computed the 
+        first time it is read rather than when the event is added.
+        """
+
+        if self.event_hash_ is None:
+            self.event_hash_ = md5(str(self.event_).encode()).hexdigest()
+        return self.event_hash_
+
+    def __repr__(self):
+        return str({"Name": self.name_,
+                    "Data": self.data_,
+                    "Timestamp": self.timestamp_,
+                    "Source": self.source_,
+                    "Hash": self.hash_,
+                    "Consumed": self.consumed_,
+                    "Event": self.event_})
@@ -12,6 +12,7 @@ from core.grammar_classes import Interaction
 
 
 class GrammarEvent:
+    __slots__ = ('sentence_', 'inferred_', 'hash_list_', 'timestamp_', 'source_event_')
 
     def __init__(self, sentence: Interaction, inferred: bool, hash_list: list, timestamp: int, source_event: dict):
         self.sentence_ = sentence
@@ -21,10 +22,15 @@ class GrammarEvent:
         self.source_event_ = source_event
 
     def __str__(self):
-        return str({"Sentence": str(self.sentence_),
-                    "Timestamp": self.timestamp_,
-                    "Inferred": self.inferred_,
-                    "Hashes": self.hash_list_})
+        # Formats the line the same way str() of a dict of these fields would, without building the dict
+        return (f"{{'Sentence': {str(self.sentence_)!r}, 'Timestamp': {self.timestamp_!r}, "
+                f"'Inferred': {self.inferred_!r}, 'Hashes': {self.hash_list_!r}}}")
+
+    def encode_into(self, buffer: bytearray):
+        """Appends the encoded output line of this grammar event to buffer"""
+
+        buffer += str(self).encode()
+        buffer += b"\n"
 
     def debug(self):
 
@@ -8,7 +8,29 @@ Description:
     
 """
 
-import hashlib
+import sys
+from bisect import bisect_left, bisect_right
+from utils.buffer_event import BufferEvent
+
+# Data fields the converters compare against string literals or each other. Their values are interned on add so that
+# equal strings share one object and those comparisons resolve on identity.
+INTERNED_DATA_FIELDS = ("EventName", "EventType", "EventSource", "Button")
+
+
+def shift_positions(index, ending_index) -> dict:
+    """
+    Returns a copy of a position index with the positions before ending_index dropped, and the rest moved down by 
+    ending_index. Keys left without positions are dropped.
+    """
+
+    shifted_index = {}
+
+    for key, positions in index.items():
+        kept = positions[bisect_left(positions, ending_index):]
+        if kept:
+            shifted_index[key] = [position - ending_index for position in kept]
+
+    return shifted_index
 
 
 class HashBuffer:
@@ -16,40 +38,63 @@ class HashBuffer:
     def __init__(self, release=True):
         self.release_ = release
         self.events_ = []
-        self.index_ = None
+        # Timestamps of self.events_ kept as their own column so time queries don't go through the event dicts
+        self.timestamps_ = []
+        # Positions in self.events_ of each event name, so a scan for one kind of event can skip over the others
+        self.name_index_ = {}
+        # Positions in self.events_ of the FieldLocationEvents of each plugin
+        self.field_index_ = {}
+        # Number of events in self.events_
+        self.n_ = 0
+        self.index_ = 0
 
     def add(self, event):
 
-        event_name = list(event.keys())[0]
-        event_data = event.get(event_name)
+        event_name = sys.intern(next(iter(event)))
+        event_data = event[event_name]
+
+        for field in INTERNED_DATA_FIELDS:
+            value = event_data.get(field)
+            if type(value) is str:
+                event_data[field] = sys.intern(value)
+
         event_timestamp = event_data.get("Timestamp")
-        event_hash = hashlib.md5(str(event).encode()).hexdigest()
-        event_consumed = False
-
-        mod_event = {
-            "Name": event_name,
-            "Data": event_data,
-            "Timestamp": event_timestamp,
-            "Hash": event_hash,
-            "Consumed": event_consumed,
-            "Event": event
-        }
+        event_source = event_data.get("EventSource")
+
+        mod_event = BufferEvent(event_name, event_data, event_timestamp, event_source)
+
+        name_positions = self.name_index_.get(event_name)
+        if name_positions is None:
+            name_positions = self.name_index_[event_name] = []
+        position = self.n_
+        name_positions.append(position)
+
+        if event_name == "FieldLocationEvent":
+            self.field_index_.setdefault(event_source, []).append(position)
 
         self.events_.append(mod_event)
+        self.timestamps_.append(event_timestamp)
+        self.n_ = position + 1
+
+        return True
 
-        if self.index_ is None:
-            self.index_ = 0
+    # Adds a batch of events in order, such as the samples of one chunk pulled from a live stream
+    def add_many(self, events):
+
+        add = self.add
+        for event in events:
+            add(event)
 
         return True
 
-    def current(self) -> dict or None:
+    def current(self) -> BufferEvent or None:
 
-        if self.index_ >= len(self.events_):
-            if not self.release_:
-                print("[ERROR] Fatal Error: current index is out of bounds!")
-            return None
+        if self.index_ < self.n_:
+            return self.events_[self.index_]
 
-        return self.events_[self.index_]
+        if not self.release_:
+            print("[ERROR] Fatal Error: current index is out of bounds!")
+        return None
 
     # Returns False if there is no more events left to parse
     def next(self):
@@ -57,34 +102,47 @@ class HashBuffer:
             self.index_ += 1
 
     def has_next(self) -> bool:
-        if self.index_ is None:
-            return False
-        return not(self.index_ >= len(self.events_))
+        return self.index_ < self.n_
+
+    # Iterating the buffer walks the index through the remaining events, so current() is the yielded event
+    def __iter__(self):
+        while self.index_ < self.n_:
+            yield self.events_[self.index_]
+            self.index_ += 1
 
     # Purge removes all events from self.events_ between 0 and ending_index
     def purge(self, ending_index):
 
-        if ending_index >= len(self.events_):
+        if ending_index >= self.n_:
             if not self.release_:
                 print("[ERROR] Fatal Error: Purge request was past ending index!")
-                print("[ERROR] EventSize: ", len(self.events_), "EndingIndex: ", ending_index)
+                print("[ERROR] EventSize: ", self.n_, "EndingIndex: ", ending_index)
             return False
 
-        self.events_ = self.events_[ending_index:]
+        # The lists are trimmed in place, and the indexes only shift the positions they already hold
+        del self.events_[:ending_index]
+        del self.timestamps_[:ending_index]
+        self.n_ -= ending_index
+        self.name_index_ = shift_positions(self.name_index_, ending_index)
+        self.field_index_ = shift_positions(self.field_index_, ending_index)
         self.reset_index()
 
     def get_buffer_time_frame(self) -> float:
 
-        first_event = self.events_[0]
-        last_event = self.events_[-1]
+        return self.timestamps_[-1] - self.timestamps_[0]
 
-        first_event_timestamp = first_event.get("Timestamp")
-        last_event_timestamp = last_event.get("Timestamp")
+    def reset_index(self):
 
-        return last_event_timestamp - first_event_timestamp
+        self.index_ = 0
 
-    def reset_index(self):
+    # Empties the buffer in place so it can be reused for the next window of events
+    def reset(self):
 
+        self.events_.clear()
+        self.timestamps_.clear()
+        self.name_index_.clear()
+        self.field_index_.clear()
+        self.n_ = 0
         self.index_ = 0
 
     def get_event_list(self):
@@ -95,8 +153,48 @@ class HashBuffer:
 
         return self.index_
 
+    def get_timestamps(self):
+
+        return self.timestamps_
+
+    # Returns the positions of the events named event_name that come after index, in order
+    def iter_after(self, event_name, index) -> list:
+
+        name_positions = self.name_index_.get(event_name)
+        if name_positions is None:
+            return []
+
+        return name_positions[bisect_right(name_positions, index):]
+
+    # Returns the positions of the events named event_name that come before index, nearest first
+    def iter_before(self, event_name, index) -> list:
+
+        name_positions = self.name_index_.get(event_name)
+        if name_positions is None:
+            return []
+
+        return name_positions[:bisect_left(name_positions, index)][::-1]
+
+    # Returns the positions of the events named event_name from start up to, but not including, end
+    def iter_between(self, event_name, start, end) -> list:
+
+        name_positions = self.name_index_.get(event_name)
+        if name_positions is None:
+            return []
+
+        return name_positions[bisect_left(name_positions, start):bisect_left(name_positions, end)]
+
+    # Returns the positions of the FieldLocationEvents that came from plugin_name, in order
+    def get_field_positions(self, plugin_name) -> list:
+
+        return self.field_index_.get(plugin_name, [])
+
+    # Like the other diagnostics of the buffer, this only prints outside of release mode
     def debug(self):
 
+        if self.release_:
+            return
+
         print("[INFO] Current: ", self.current())
         print("[INFO] BufferTimeFrame: ", self.get_buffer_time_frame())
 